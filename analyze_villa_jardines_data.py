@@ -7,19 +7,87 @@ creates a unit price feature (price/square_meters), and visualizes the distribut
 with percentile regions highlighted.
 """
 
+import csv
+import functools
+import sys
+from importlib.util import find_spec
+from typing import NamedTuple
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
 import warnings
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
-# Set style for better plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# CSV parser: pyarrow's multi-threaded reader when installed, else pandas' C engine
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') else 'c'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plt():
+    """Import pyplot on first use and apply the plot style once."""
+    # Plotting libraries are only imported when a plot is actually drawn
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set style for better plots
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    return plt
+
+
+def gaussian_kde_grid(samples, lo, hi, num_points=1000):
+    """Evaluate a Gaussian KDE of samples (Scott's rule bandwidth) on linspace(lo, hi, num_points)."""
+    samples = np.asarray(samples, dtype=np.float64)
+    n = samples.size
+    inv_bandwidth = 1.0 / (samples.std(ddof=1) * n ** (-1.0 / 5.0))
+    x = np.linspace(lo, hi, num_points)
+    # A single (grid x samples) buffer, transformed in place into kernel values
+    kernel = np.subtract.outer(x, samples)
+    kernel *= inv_bandwidth
+    np.square(kernel, out=kernel)
+    kernel *= -0.5
+    np.exp(kernel, out=kernel)
+    y = kernel.sum(axis=1)
+    y *= inv_bandwidth / (n * np.sqrt(2.0 * np.pi))
+    return x, y
+
+
+class UnitPriceStats(NamedTuple):
+    """Summary statistics of the unit price (thousands of CLP per m²)."""
+    mean: float
+    median: float
+    std: float
+    min: float
+    max: float
+    q10: float
+    q25: float
+    q75: float
+    q90: float
+
+
+def quantile_from_sorted(sorted_values, probs):
+    """Linearly interpolated quantiles of already sorted data (numpy's default method)."""
+    # No data: NaN for every quantile, as np.percentile returns
+    if sorted_values.size == 0:
+        return np.full(np.shape(probs), np.nan)
+    positions = np.asarray(probs, dtype=float) * (sorted_values.size - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, sorted_values.size - 1)
+    frac = positions - lower
+    return sorted_values[lower] * (1.0 - frac) + sorted_values[upper] * frac
+
+
+def skew_kurtosis(values):
+    """Biased skewness and excess kurtosis (scipy.stats defaults) from shared central moments."""
+    deviations = np.asarray(values, dtype=np.float64)
+    deviations = deviations - deviations.mean()
+    squared = deviations * deviations
+    m2 = squared.mean()
+    m3 = (squared * deviations).mean()
+    m4 = (squared * squared).mean()
+    return m3 / m2 ** 1.5, m4 / (m2 * m2) - 3.0
+
 
 class VillaJardinesAnalyzer:
     """Analyzer for Villa Los Jardines property data."""
@@ -28,14 +96,35 @@ class VillaJardinesAnalyzer:
         """Initialize the analyzer with the CSV file."""
         self.csv_file = csv_file
         self.df = None
-        self.unit_price_stats = {}
+        self.unit_price_stats = None
+        self.sorted_df = None
+        self.sorted_values = None
+        self._kde_x = None
+        self._kde_y = None
         
     def load_data(self):
         """Load and prepare the data."""
         print("Loading Villa Los Jardines property data...")
         
-        # Load the CSV file
-        self.df = pd.read_csv(self.csv_file)
+        # Skip the bulky raw_text column; every scraped field is kept so the
+        # enhanced dataset carries them through. (The pyarrow engine does not
+        # accept a callable usecols, so the names come from the header row.)
+        with open(self.csv_file, newline='', encoding='utf-8') as f:
+            usecols = [column for column in next(csv.reader(f)) if column != 'raw_text']
+        
+        # Explicit dtypes for the numeric columns (no inference pass). Prices
+        # stay float64: sale prices above 2**24 CLP are not exact in float32.
+        self.df = pd.read_csv(
+            self.csv_file,
+            engine=CSV_ENGINE,
+            usecols=usecols,
+            dtype={
+                'price': 'float64',
+                'square_meters': 'float32',
+                'bedrooms': 'float32',
+                'bathrooms': 'float32'
+            }
+        )
         
         # Display basic info
         print(f"Dataset shape: {self.df.shape}")
@@ -49,36 +138,49 @@ class VillaJardinesAnalyzer:
         return self.df
     
     def create_unit_price_feature(self):
-        """Create the unit_price feature (price per square meter)."""
+        """Create the unit price feature (thousands of CLP per square meter)."""
         print("\n" + "="*50)
         print("CREATING UNIT PRICE FEATURE")
         print("="*50)
         
-        # Calculate unit price (price per square meter)
-        self.df['unit_price'] = self.df['price'] / self.df['square_meters']
-        
-        # Convert to thousands of CLP per m² for easier reading
-        self.df['unit_price_k_clp_m2'] = self.df['unit_price'] / 1000
-        
-        # Calculate statistics
-        self.unit_price_stats = {
-            'mean': self.df['unit_price_k_clp_m2'].mean(),
-            'median': self.df['unit_price_k_clp_m2'].median(),
-            'std': self.df['unit_price_k_clp_m2'].std(),
-            'min': self.df['unit_price_k_clp_m2'].min(),
-            'max': self.df['unit_price_k_clp_m2'].max(),
-            'q10': self.df['unit_price_k_clp_m2'].quantile(0.10),
-            'q25': self.df['unit_price_k_clp_m2'].quantile(0.25),
-            'q75': self.df['unit_price_k_clp_m2'].quantile(0.75),
-            'q90': self.df['unit_price_k_clp_m2'].quantile(0.90)
-        }
+        # Calculate unit price (thousands of CLP per m²) in a single pass over
+        # the raw arrays; listings without a positive size get NaN, not inf.
+        # Only this working copy of the prices is float32 (half the bytes for
+        # every pass below); the price column itself keeps full precision.
+        square_meters = self.df['square_meters'].to_numpy()
+        price = self.df['price'].to_numpy(dtype=np.float32)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            unit_price_k = np.where(square_meters > 0, price / (square_meters * 1000.0), np.nan)
+        self.df['unit_price_k_clp_m2'] = unit_price_k
+        
+        # Sort once (NaN last); percentile slicing, quantiles and the Q-Q plot
+        # all read from this ordering
+        order = np.argsort(unit_price_k, kind='stable')
+        self.sorted_df = self.df.iloc[order]
+        n_valid = np.count_nonzero(~np.isnan(unit_price_k))
+        self.sorted_values = unit_price_k[order[:n_valid]]
+        
+        # Calculate statistics (order statistics are index lookups on the sort)
+        q_min, q10, q25, median, q75, q90, q_max = quantile_from_sorted(
+            self.sorted_values, [0.0, 0.10, 0.25, 0.50, 0.75, 0.90, 1.0])
+        self.unit_price_stats = UnitPriceStats(
+            mean=self.sorted_values.mean(dtype=np.float64),
+            median=median,
+            std=self.sorted_values.std(ddof=1, dtype=np.float64),
+            min=q_min,
+            max=q_max,
+            q10=q10,
+            q25=q25,
+            q75=q75,
+            q90=q90
+        )
         
         print("Unit Price Statistics (thousands of CLP per m²):")
-        for stat, value in self.unit_price_stats.items():
+        for stat, value in self.unit_price_stats._asdict().items():
             print(f"  {stat.upper()}: {value:.2f}")
         
-        print(f"\nUnit price range: {self.unit_price_stats['min']:.2f} - {self.unit_price_stats['max']:.2f} k CLP/m²")
-        print(f"Average unit price: {self.unit_price_stats['mean']:.2f} k CLP/m²")
+        print(f"\nUnit price range: {self.unit_price_stats.min:.2f} - {self.unit_price_stats.max:.2f} k CLP/m²")
+        print(f"Average unit price: {self.unit_price_stats.mean:.2f} k CLP/m²")
         
         return self.df
     
@@ -89,59 +191,87 @@ class VillaJardinesAnalyzer:
         print("="*50)
         
         # Basic statistics
+        skewness, kurtosis = skew_kurtosis(self.sorted_values)
         print("Distribution Statistics:")
-        print(f"  Skewness: {stats.skew(self.df['unit_price_k_clp_m2']):.3f}")
-        print(f"  Kurtosis: {stats.kurtosis(self.df['unit_price_k_clp_m2']):.3f}")
+        print(f"  Skewness: {skewness:.3f}")
+        print(f"  Kurtosis: {kurtosis:.3f}")
         
         # Percentile information
         print(f"\nPercentile Information:")
-        print(f"  10th percentile: {self.unit_price_stats['q10']:.2f} k CLP/m²")
-        print(f"  25th percentile: {self.unit_price_stats['q25']:.2f} k CLP/m²")
-        print(f"  50th percentile (median): {self.unit_price_stats['median']:.2f} k CLP/m²")
-        print(f"  75th percentile: {self.unit_price_stats['q75']:.2f} k CLP/m²")
-        print(f"  90th percentile: {self.unit_price_stats['q90']:.2f} k CLP/m²")
-        
-        # Properties in extreme percentiles
-        low_percentile = self.df[self.df['unit_price_k_clp_m2'] <= self.unit_price_stats['q10']]
-        high_percentile = self.df[self.df['unit_price_k_clp_m2'] >= self.unit_price_stats['q90']]
-        
-        print(f"\nProperties in bottom 10% (≤{self.unit_price_stats['q10']:.2f} k CLP/m²): {len(low_percentile)}")
-        print(f"Properties in top 10% (≥{self.unit_price_stats['q90']:.2f} k CLP/m²): {len(high_percentile)}")
+        print(f"  10th percentile: {self.unit_price_stats.q10:.2f} k CLP/m²")
+        print(f"  25th percentile: {self.unit_price_stats.q25:.2f} k CLP/m²")
+        print(f"  50th percentile (median): {self.unit_price_stats.median:.2f} k CLP/m²")
+        print(f"  75th percentile: {self.unit_price_stats.q75:.2f} k CLP/m²")
+        print(f"  90th percentile: {self.unit_price_stats.q90:.2f} k CLP/m²")
+        
+        # Properties in extreme percentiles: cut the sorted frame at the
+        # percentile boundaries
+        n_valid = self.sorted_values.size
+        low_end = np.searchsorted(self.sorted_values, self.unit_price_stats.q10, side='right')
+        high_start = np.searchsorted(self.sorted_values, self.unit_price_stats.q90, side='left')
+        low_percentile = self.sorted_df.iloc[:low_end]
+        high_percentile = self.sorted_df.iloc[high_start:n_valid]
+        
+        print(f"\nProperties in bottom 10% (≤{self.unit_price_stats.q10:.2f} k CLP/m²): {len(low_percentile)}")
+        print(f"Properties in top 10% (≥{self.unit_price_stats.q90:.2f} k CLP/m²): {len(high_percentile)}")
         
         return low_percentile, high_percentile
     
-    def plot_unit_price_distribution(self):
-        """Create comprehensive plots of the unit price distribution."""
+    def plot_unit_price_distribution(self, show=False, dpi=150):
+        """Create comprehensive plots of the unit price distribution.
+        
+        The figure is only saved unless show=True; the save-only path draws on a
+        standalone Figure, so no GUI toolkit is started and pyplot's backend is
+        left alone for later interactive use.
+        """
         print("\n" + "="*50)
         print("CREATING UNIT PRICE DISTRIBUTION PLOTS")
         print("="*50)
         
-        # Create figure with subplots
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+        plt = _get_plt()
+        
+        # Evaluate the density once; both density panels reuse it
+        self._kde_x, self._kde_y = self._compute_kde()
+        
+        # Create one figure: a 2x2 grid plus the detailed plot across the bottom
+        if show:
+            fig = plt.figure(figsize=(15, 18))
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(15, 18))
+        grid = fig.add_gridspec(3, 2)
         fig.suptitle('Villa Los Jardines - Unit Price Distribution Analysis', fontsize=16, fontweight='bold')
         
         # 1. Histogram with percentile regions
-        ax1 = axes[0, 0]
+        ax1 = fig.add_subplot(grid[0, 0])
         self._plot_histogram_with_percentiles(ax1)
         
         # 2. Box plot
-        ax2 = axes[0, 1]
+        ax2 = fig.add_subplot(grid[0, 1])
         self._plot_boxplot(ax2)
         
         # 3. Density plot with percentile regions
-        ax3 = axes[1, 0]
+        ax3 = fig.add_subplot(grid[1, 0])
         self._plot_density_with_percentiles(ax3)
         
         # 4. Q-Q plot for normality check
-        ax4 = axes[1, 1]
+        ax4 = fig.add_subplot(grid[1, 1])
         self._plot_qq_plot(ax4)
         
-        plt.tight_layout()
-        plt.savefig('villa_jardines_unit_price_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        # 5. Detailed distribution with statistics
+        ax5 = fig.add_subplot(grid[2, :])
+        self._plot_detailed_distribution(ax5)
         
-        # Create additional detailed plot
-        self._create_detailed_distribution_plot()
+        fig.tight_layout(rect=(0, 0, 1, 0.98))
+        fig.savefig('villa_jardines_unit_price_analysis.png', dpi=dpi, bbox_inches='tight')
+        if show:
+            plt.show()
+            plt.close(fig)
+    
+    def _compute_kde(self, num_points=1000):
+        """Evaluate the unit price density on an evenly spaced grid."""
+        values = self.sorted_values
+        return gaussian_kde_grid(values, values[0], values[-1], num_points)
     
     def _plot_histogram_with_percentiles(self, ax):
         """Plot histogram with percentile regions highlighted."""
@@ -149,19 +279,21 @@ class VillaJardinesAnalyzer:
         n, bins, patches = ax.hist(self.df['unit_price_k_clp_m2'], bins=30, alpha=0.7, 
                                  color='lightblue', edgecolor='black', density=True)
         
-        # Highlight regions under 10th and over 90th percentile
-        for i, (patch, bin_edge) in enumerate(zip(patches, bins)):
-            if bin_edge <= self.unit_price_stats['q10'] or bin_edge >= self.unit_price_stats['q90']:
-                patch.set_facecolor('blue')
-                patch.set_alpha(0.8)
+        # Highlight regions under 10th and over 90th percentile (by left bin edge)
+        left_edges = bins[:-1]
+        highlight = np.nonzero((left_edges <= self.unit_price_stats.q10) |
+                               (left_edges >= self.unit_price_stats.q90))[0]
+        for i in highlight:
+            patches[i].set_facecolor('blue')
+            patches[i].set_alpha(0.8)
         
         # Add vertical lines for percentiles
-        ax.axvline(self.unit_price_stats['q10'], color='red', linestyle='--', linewidth=2, 
-                  label=f'10th percentile ({self.unit_price_stats["q10"]:.1f})')
-        ax.axvline(self.unit_price_stats['median'], color='green', linestyle='--', linewidth=2, 
-                  label=f'Median ({self.unit_price_stats["median"]:.1f})')
-        ax.axvline(self.unit_price_stats['q90'], color='red', linestyle='--', linewidth=2, 
-                  label=f'90th percentile ({self.unit_price_stats["q90"]:.1f})')
+        ax.axvline(self.unit_price_stats.q10, color='red', linestyle='--', linewidth=2, 
+                  label=f'10th percentile ({self.unit_price_stats.q10:.1f})')
+        ax.axvline(self.unit_price_stats.median, color='green', linestyle='--', linewidth=2, 
+                  label=f'Median ({self.unit_price_stats.median:.1f})')
+        ax.axvline(self.unit_price_stats.q90, color='red', linestyle='--', linewidth=2, 
+                  label=f'90th percentile ({self.unit_price_stats.q90:.1f})')
         
         ax.set_xlabel('Unit Price (k CLP/m²)')
         ax.set_ylabel('Density')
@@ -181,32 +313,30 @@ class VillaJardinesAnalyzer:
         ax.grid(True, alpha=0.3)
         
         # Add statistics as text
-        stats_text = f'Mean: {self.unit_price_stats["mean"]:.1f}\n'
-        stats_text += f'Median: {self.unit_price_stats["median"]:.1f}\n'
-        stats_text += f'Std: {self.unit_price_stats["std"]:.1f}'
+        stats_text = f'Mean: {self.unit_price_stats.mean:.1f}\n'
+        stats_text += f'Median: {self.unit_price_stats.median:.1f}\n'
+        stats_text += f'Std: {self.unit_price_stats.std:.1f}'
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, verticalalignment='top',
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
     
     def _plot_density_with_percentiles(self, ax):
         """Plot density plot with percentile regions."""
         # Create density plot
-        sns.kdeplot(data=self.df['unit_price_k_clp_m2'], ax=ax, color='blue', linewidth=2)
+        x, y = self._kde_x, self._kde_y
+        ax.plot(x, y, color='blue', linewidth=2)
         
         # Shade regions under 10th and over 90th percentile
-        x = np.linspace(self.df['unit_price_k_clp_m2'].min(), self.df['unit_price_k_clp_m2'].max(), 1000)
-        y = stats.gaussian_kde(self.df['unit_price_k_clp_m2'])(x)
-        
         # Shade bottom 10%
-        mask_low = x <= self.unit_price_stats['q10']
+        mask_low = x <= self.unit_price_stats.q10
         ax.fill_between(x[mask_low], y[mask_low], alpha=0.3, color='blue', label='Bottom 10%')
         
         # Shade top 10%
-        mask_high = x >= self.unit_price_stats['q90']
+        mask_high = x >= self.unit_price_stats.q90
         ax.fill_between(x[mask_high], y[mask_high], alpha=0.3, color='blue', label='Top 10%')
         
         # Add vertical lines
-        ax.axvline(self.unit_price_stats['q10'], color='red', linestyle='--', linewidth=2)
-        ax.axvline(self.unit_price_stats['q90'], color='red', linestyle='--', linewidth=2)
+        ax.axvline(self.unit_price_stats.q10, color='red', linestyle='--', linewidth=2)
+        ax.axvline(self.unit_price_stats.q90, color='red', linestyle='--', linewidth=2)
         
         ax.set_xlabel('Unit Price (k CLP/m²)')
         ax.set_ylabel('Density')
@@ -216,40 +346,46 @@ class VillaJardinesAnalyzer:
     
     def _plot_qq_plot(self, ax):
         """Plot Q-Q plot to check normality."""
-        stats.probplot(self.df['unit_price_k_clp_m2'], dist="norm", plot=ax)
+        from scipy import stats
+        
+        # The values are already sorted, so the ordered sample is used as is
+        ordered = self.sorted_values
+        n = ordered.size
+        theoretical = stats.norm.ppf((np.arange(1, n + 1) - 0.5) / n)
+        slope, intercept = np.polyfit(theoretical, ordered, 1)
+        ax.plot(theoretical, ordered, 'bo')
+        ax.plot(theoretical, slope * theoretical + intercept, 'r-')
+        ax.set_xlabel('Theoretical quantiles')
+        ax.set_ylabel('Ordered Values')
         ax.set_title('Q-Q Plot (Normality Check)')
         ax.grid(True, alpha=0.3)
     
-    def _create_detailed_distribution_plot(self):
-        """Create a detailed single plot focusing on the distribution."""
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
+    def _plot_detailed_distribution(self, ax):
+        """Plot a detailed view of the distribution with statistics."""
         # Create histogram with density overlay
         ax.hist(self.df['unit_price_k_clp_m2'], bins=25, alpha=0.6, color='lightblue', 
                edgecolor='black', density=True, label='Histogram')
         
         # Add density curve
-        sns.kdeplot(data=self.df['unit_price_k_clp_m2'], ax=ax, color='red', linewidth=2, label='Density')
+        x, y = self._kde_x, self._kde_y
+        ax.plot(x, y, color='red', linewidth=2, label='Density')
         
         # Shade extreme percentile regions in blue
-        x = np.linspace(self.df['unit_price_k_clp_m2'].min(), self.df['unit_price_k_clp_m2'].max(), 1000)
-        y = stats.gaussian_kde(self.df['unit_price_k_clp_m2'])(x)
-        
         # Shade bottom 10%
-        mask_low = x <= self.unit_price_stats['q10']
+        mask_low = x <= self.unit_price_stats.q10
         ax.fill_between(x[mask_low], y[mask_low], alpha=0.4, color='blue', label='Bottom 10%')
         
         # Shade top 10%
-        mask_high = x >= self.unit_price_stats['q90']
+        mask_high = x >= self.unit_price_stats.q90
         ax.fill_between(x[mask_high], y[mask_high], alpha=0.4, color='blue', label='Top 10%')
         
         # Add vertical lines for key percentiles
-        ax.axvline(self.unit_price_stats['q10'], color='darkblue', linestyle='--', linewidth=2, 
-                  label=f'10th percentile ({self.unit_price_stats["q10"]:.1f})')
-        ax.axvline(self.unit_price_stats['median'], color='green', linestyle='-', linewidth=2, 
-                  label=f'Median ({self.unit_price_stats["median"]:.1f})')
-        ax.axvline(self.unit_price_stats['q90'], color='darkblue', linestyle='--', linewidth=2, 
-                  label=f'90th percentile ({self.unit_price_stats["q90"]:.1f})')
+        ax.axvline(self.unit_price_stats.q10, color='darkblue', linestyle='--', linewidth=2, 
+                  label=f'10th percentile ({self.unit_price_stats.q10:.1f})')
+        ax.axvline(self.unit_price_stats.median, color='green', linestyle='-', linewidth=2, 
+                  label=f'Median ({self.unit_price_stats.median:.1f})')
+        ax.axvline(self.unit_price_stats.q90, color='darkblue', linestyle='--', linewidth=2, 
+                  label=f'90th percentile ({self.unit_price_stats.q90:.1f})')
         
         ax.set_xlabel('Unit Price (k CLP/m²)', fontsize=12)
         ax.set_ylabel('Density', fontsize=12)
@@ -259,17 +395,13 @@ class VillaJardinesAnalyzer:
         ax.grid(True, alpha=0.3)
         
         # Add statistics text box
-        stats_text = f'Mean: {self.unit_price_stats["mean"]:.1f} k CLP/m²\n'
-        stats_text += f'Median: {self.unit_price_stats["median"]:.1f} k CLP/m²\n'
-        stats_text += f'Std Dev: {self.unit_price_stats["std"]:.1f} k CLP/m²\n'
-        stats_text += f'Range: {self.unit_price_stats["min"]:.1f} - {self.unit_price_stats["max"]:.1f} k CLP/m²'
+        stats_text = f'Mean: {self.unit_price_stats.mean:.1f} k CLP/m²\n'
+        stats_text += f'Median: {self.unit_price_stats.median:.1f} k CLP/m²\n'
+        stats_text += f'Std Dev: {self.unit_price_stats.std:.1f} k CLP/m²\n'
+        stats_text += f'Range: {self.unit_price_stats.min:.1f} - {self.unit_price_stats.max:.1f} k CLP/m²'
         
         ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, verticalalignment='top',
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.9), fontsize=10)
-        
-        plt.tight_layout()
-        plt.savefig('villa_jardines_unit_price_distribution.png', dpi=300, bbox_inches='tight')
-        plt.show()
     
     def show_extreme_properties(self, low_percentile, high_percentile):
         """Display properties in extreme percentiles."""
@@ -286,12 +418,23 @@ class VillaJardinesAnalyzer:
     def save_enhanced_data(self):
         """Save the enhanced dataset with unit price features."""
         output_file = 'villa_jardines_enhanced_data.csv'
-        self.df.to_csv(output_file, index=False)
+        
+        try:
+            # pyarrow's C++ CSV writer; fall back to pandas when pyarrow is not
+            # installed or cannot convert the frame (Arrow's conversion errors
+            # subclass TypeError, ValueError and NotImplementedError)
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            
+            table = pa.Table.from_pandas(self.df, preserve_index=False)
+            pa_csv.write_csv(table, output_file)
+        except (ImportError, TypeError, ValueError, NotImplementedError):
+            self.df.to_csv(output_file, index=False)
         print(f"\nEnhanced dataset saved to: {output_file}")
         return output_file
     
-    def run_analysis(self):
-        """Run the complete analysis."""
+    def run_analysis(self, show=False):
+        """Run the complete analysis; show=True also opens the plots in a window."""
         print("VILLA LOS JARDINES PROPERTY DATA ANALYSIS")
         print("="*60)
         
@@ -305,7 +448,7 @@ class VillaJardinesAnalyzer:
         low_percentile, high_percentile = self.show_unit_price_distribution()
         
         # Create plots
-        self.plot_unit_price_distribution()
+        self.plot_unit_price_distribution(show=show)
         
         # Show extreme properties
         self.show_extreme_properties(low_percentile, high_percentile)
@@ -318,15 +461,15 @@ class VillaJardinesAnalyzer:
         print("="*60)
 
 
-def main():
+def main(show=False):
     """Main function to run the analysis."""
     # File path
     csv_file = 'villa_jardines_properties_20250805_125939.csv'
     
     # Create analyzer and run analysis
     analyzer = VillaJardinesAnalyzer(csv_file)
-    analyzer.run_analysis()
+    analyzer.run_analysis(show=show)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main(show='--show' in sys.argv[1:]) 
\ No newline at end of file
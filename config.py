@@ -3,8 +3,20 @@ Configuration file for Portal Inmobiliario scraper
 """
 
 import os
+import re
+import logging
+from importlib.util import find_spec
+import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    import re2  # Optional: google-re2 gives linear-time matching
+except ImportError:
+    re2 = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -15,18 +27,23 @@ BASE_URL = "https://www.portalinmobiliario.com/arriendo/departamento/santiago-me
 MAX_PAGES = int(os.getenv('SCRAPER_MAX_PAGES', 3))  # Maximum number of pages to scrape
 DELAY_BETWEEN_PAGES = int(os.getenv('SCRAPER_DELAY', 2))  # Seconds to wait between page requests
 DELAY_BETWEEN_REQUESTS = 3  # Seconds to wait between individual requests
+MAX_CONCURRENT_PAGES = int(os.getenv('SCRAPER_CONCURRENCY', 4))  # Pages fetched in parallel (1 = sequential)
 
 # Browser settings (for Selenium scraper)
 HEADLESS_MODE = os.getenv('SCRAPER_HEADLESS', 'true').lower() == 'true'  # Set to False for debugging
+REQUIRE_JS = os.getenv('SCRAPER_REQUIRE_JS', 'false').lower() == 'true'  # Only start Chrome when pages need JavaScript
 BROWSER_WINDOW_SIZE = "1920,1080"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')  # Use this driver binary and skip webdriver-manager
+CHROMEDRIVER_CACHE_DAYS = 30  # Days before webdriver-manager checks for a newer driver
+CHROMEDRIVER_PATH_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'rent-scraper', 'chromedriver_path')
 
 # API Keys (load from environment variables)
 MAP_API_KEY = os.getenv('MAP_API_KEY')  # Google Maps API key if needed
 EXTERNAL_API_KEY = os.getenv('EXTERNAL_API_KEY')  # Any external API keys
 
 # Output settings
-OUTPUT_FORMATS = ["csv", "json"]  # Available: "csv", "json"
+OUTPUT_FORMATS = ["csv", "json"]  # Available: "csv", "json" (written as JSON Lines)
 OUTPUT_PREFIX = "rental_properties"
 
 # Data extraction patterns
@@ -61,6 +78,63 @@ ADDRESS_PATTERNS = [
     r'[A-Z][a-z]+.*?RM'
 ]
 
+
+# Every "\d+" or "(\d+" digit run in a pattern
+_DIGIT_RUN_REGEX = re.compile(r'\(?\\d\+')
+
+
+def _anchor_digit_runs(pattern):
+    """Prefix each digit run with (?<!\d) so a backtracking engine starts numbers at the start of their run."""
+    # Without the anchor a failed match is retried from every digit inside a run,
+    # which costs quadratic time on long digit runs. The leftmost match is unchanged.
+    return _DIGIT_RUN_REGEX.sub(lambda match: r'(?<!\d)' + match.group(0), pattern)
+
+
+def _compile(pattern):
+    """Compile a pattern with RE2 when installed, falling back to re for unsupported syntax."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            # RE2 has no lookaround; those patterns stay on the re engine
+            logging.getLogger(__name__).debug(f"RE2 cannot compile {pattern!r}, using re")
+    # RE2 runs in linear time; only the backtracking re engine needs the digit-run anchor
+    return re.compile(_anchor_digit_runs(pattern))
+
+
+# Pre-compiled versions of the patterns above (same order, first match wins).
+# Scrapers should use these instead of calling re.search() with the strings.
+PRICE_REGEXES = tuple(_compile(p) for p in PRICE_PATTERNS)
+SQUARE_METERS_REGEXES = tuple(_compile(p) for p in SQUARE_METERS_PATTERNS)
+BEDROOMS_REGEXES = tuple(_compile(p) for p in BEDROOMS_PATTERNS)
+BATHROOMS_REGEXES = tuple(_compile(p) for p in BATHROOMS_PATTERNS)
+ADDRESS_REGEXES = tuple(_compile(p) for p in ADDRESS_PATTERNS)
+
+# Cheap prefilters: numeric fields need a digit, address patterns an uppercase letter
+DIGIT_REGEX = re.compile(r'\d')
+UPPERCASE_REGEX = re.compile(r'[A-Z]')
+
+# Numeric field regexes, keyed by the property field they fill
+NUMERIC_FIELD_REGEXES = {
+    'price': PRICE_REGEXES,
+    'square_meters': SQUARE_METERS_REGEXES,
+    'bedrooms': BEDROOMS_REGEXES,
+    'bathrooms': BATHROOMS_REGEXES,
+}
+
+
+def find_numeric_fields(text):
+    """Return {field: captured values} with each field's values yielded lazily in pattern priority order."""
+    # Every numeric pattern needs a digit; skip the scan for text without one
+    if not DIGIT_REGEX.search(text):
+        return {}
+
+    # Generators, so a caller that stops at the first usable value skips the lower-priority searches
+    return {
+        field: (match.group(1) for match in (regex.search(text) for regex in regexes) if match)
+        for field, regexes in NUMERIC_FIELD_REGEXES.items()
+    }
+
 # Property container selectors (CSS selectors to find property listings)
 PROPERTY_SELECTORS = [
     'article',
@@ -74,6 +148,12 @@ PROPERTY_SELECTORS = [
     'div[class*="listing"]'
 ]
 
+# Selectors compiled once for BeautifulSoup-based scrapers, as (selector, compiled) pairs
+COMPILED_PROPERTY_SELECTORS = tuple((selector, soupsieve.compile(selector)) for selector in PROPERTY_SELECTORS)
+
+# HTML parser for BeautifulSoup: the C-backed lxml when installed, else the stdlib parser
+HTML_PARSER = 'lxml' if find_spec('lxml') else 'html.parser'
+
 # Logging settings
 LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR
 LOG_FILE = "scraper.log"
@@ -83,18 +163,43 @@ LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 REQUEST_HEADERS = {
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'es-ES,es;q=0.8,en-US;q=0.5,en;q=0.3',
-    'Accept-Encoding': 'gzip, deflate',
+    'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,  # includes br when brotli is installed
     'Connection': 'keep-alive',
     'Upgrade-Insecure-Requests': '1',
 }
 
+
+def make_session(headers=None):
+    """Create a requests.Session that reuses connections across page requests."""
+    session = requests.Session()
+    # Retry failed connections and throttling/server errors with exponential back-off,
+    # waiting as long as a Retry-After header asks
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        status_forcelist=RETRY_STATUS_CODES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # One pooled keep-alive connection per concurrent page fetch
+    adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_PAGES, pool_maxsize=MAX_CONCURRENT_PAGES, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(REQUEST_HEADERS)
+    session.headers['User-Agent'] = USER_AGENT
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
 # Timeout settings
 REQUEST_TIMEOUT = 30  # Seconds
 PAGE_LOAD_TIMEOUT = 10  # Seconds for Selenium
 
 # Retry settings
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # Seconds
+RETRY_DELAY = 5  # Seconds; base for the exponential back-off between retries
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)  # Responses worth retrying
 
 # Data validation
 MIN_PRICE = 100000  # Minimum valid price in CLP
@@ -111,6 +216,6 @@ MIN_PRICE_FILTER = None  # Minimum price filter
 MAX_PRICE_FILTER = None  # Maximum price filter
 
 # Export settings
-INCLUDE_RAW_TEXT = True  # Include raw text in output for debugging
+INCLUDE_RAW_TEXT = os.getenv('SCRAPER_INCLUDE_RAW_TEXT', 'false').lower() == 'true'  # Include raw text in output for debugging
 INCLUDE_TIMESTAMP = True  # Include timestamp in output
 ENCODING = 'utf-8'  # Output file encoding 
\ No newline at end of file
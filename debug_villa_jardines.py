@@ -16,16 +16,18 @@ def debug_page_structure():
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'es-ES,es;q=0.8,en-US;q=0.5,en;q=0.3',
-        'Accept-Encoding': 'gzip, deflate',
+        'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
     }
     
     print("Fetching page...")
-    response = requests.get(url, headers=headers, timeout=30)
+    with requests.Session() as session:
+        session.headers.update(headers)
+        response = session.get(url, timeout=30)
     response.raise_for_status()
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
     
     print(f"Page title: {soup.title.string if soup.title else 'No title'}")
     
@@ -0,0 +1,85 @@
+"""
+Streaming output for the Portal Inmobiliario scrapers
+
+Properties are written to disk page by page as JSON Lines and CSV, so a long
+scrape never has to hold every result in memory.
+"""
+
+import csv
+import json
+import logging
+import operator
+from datetime import datetime
+from typing import Dict, Iterable
+
+import config
+
+try:
+    import orjson  # Optional: several times faster than the json module
+except ImportError:
+    orjson = None
+
+
+def _json_line(prop: Dict) -> bytes:
+    """Serialize one property as a UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(prop, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(prop, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+class PropertyWriter:
+    """Append scraped properties to JSON Lines and CSV output files."""
+    
+    def __init__(self, prefix: str = config.OUTPUT_PREFIX):
+        """Prepare output file names; files are opened on the first write."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.json_filename = f"{prefix}_{timestamp}.jsonl" if "json" in config.OUTPUT_FORMATS else None
+        self.csv_filename = f"{prefix}_{timestamp}.csv" if "csv" in config.OUTPUT_FORMATS else None
+        self.logger = logging.getLogger(__name__)
+        
+        self.count = 0
+        self._json_file = None
+        self._csv_file = None
+        self._csv_writer = None
+        self._csv_row = None
+    
+    def _open(self, fieldnames: Iterable[str]):
+        """Open the output files and write the CSV header."""
+        if self.json_filename:
+            self._json_file = open(self.json_filename, 'wb')  # JSON Lines is always UTF-8
+        if self.csv_filename:
+            self._csv_file = open(self.csv_filename, 'w', newline='', encoding=config.ENCODING)
+            # Every property has the same keys, so rows are built with one itemgetter
+            # instead of csv.DictWriter's per-row key checks
+            fieldnames = list(fieldnames)
+            self._csv_row = operator.itemgetter(*fieldnames)
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(fieldnames)
+    
+    def write(self, properties: Iterable[Dict]):
+        """Write a batch of properties (typically one page) to every output file."""
+        properties = list(properties)
+        if not properties:
+            return
+        if self.count == 0:
+            self._open(properties[0].keys())
+        
+        if self._json_file:
+            self._json_file.writelines(map(_json_line, properties))
+        if self._csv_writer:
+            self._csv_writer.writerows(map(self._csv_row, properties))
+        self.count += len(properties)
+    
+    def close(self):
+        """Flush and close the output files."""
+        if self.count == 0:
+            self.logger.warning("No properties to export")
+            return
+        
+        if self._json_file:
+            self._json_file.close()
+            self.logger.info(f"Data exported to JSON Lines: {self.json_filename}")
+        if self._csv_file:
+            self._csv_file.close()
+            self.logger.info(f"Data exported to CSV: {self.csv_filename}")
+
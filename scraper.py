@@ -6,11 +6,9 @@ This scraper uses Selenium WebDriver to handle JavaScript-rendered content
 and provides more accurate data extraction for dynamic websites.
 """
 
+import os
 import time
-import json
-import csv
 import logging
-import re
 from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin, urlparse
@@ -21,11 +19,26 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
 from fake_useragent import UserAgent
 
 import config
+from property_writer import PropertyWriter
+from simple_scraper_no_selenium import MinimalPortalInmobiliarioScraper
+
+
+# Runs in the browser: returns [selector, elements] for the first selector that matches
+FIRST_MATCHING_SELECTOR_SCRIPT = """
+for (const selector of arguments[0]) {
+    const elements = document.querySelectorAll(selector);
+    if (elements.length) {
+        return [selector, Array.from(elements)];
+    }
+}
+return [null, []];
+"""
 
 
 class PortalInmobiliarioScraper:
@@ -38,6 +51,7 @@ class PortalInmobiliarioScraper:
         self.delay_between_pages = config.DELAY_BETWEEN_PAGES
         self.delay_between_requests = config.DELAY_BETWEEN_REQUESTS
         self.headless_mode = config.HEADLESS_MODE
+        self.require_js = config.REQUIRE_JS
         self.browser_window_size = config.BROWSER_WINDOW_SIZE
         self.user_agent = config.USER_AGENT
         self.timeout = config.PAGE_LOAD_TIMEOUT
@@ -55,9 +69,10 @@ class PortalInmobiliarioScraper:
         )
         self.logger = logging.getLogger(__name__)
         
-        # Initialize data storage
-        self.properties = []
+        # Output writer, created when the run starts
+        self.writer = None
         self.driver = None
+        self.http_scraper = None
         
     def setup_driver(self):
         """Setup Chrome WebDriver with appropriate options."""
@@ -75,10 +90,8 @@ class PortalInmobiliarioScraper:
             chrome_options.add_argument("--disable-extensions")
             chrome_options.add_argument("--disable-plugins")
             chrome_options.add_argument("--disable-images")
-            chrome_options.add_argument("--disable-javascript")
             
-            # Use webdriver-manager to automatically download and manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._chromedriver_path())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.set_page_load_timeout(self.timeout)
             
@@ -88,7 +101,36 @@ class PortalInmobiliarioScraper:
             self.logger.error(f"Failed to setup Chrome WebDriver: {e}")
             raise
     
-    def extract_property_data(self, property_element) -> Optional[Dict]:
+    def _chromedriver_path(self) -> str:
+        """Return a ChromeDriver path, avoiding webdriver-manager's update check when possible."""
+        # An explicitly configured driver always wins
+        if config.CHROMEDRIVER_PATH and os.path.isfile(config.CHROMEDRIVER_PATH):
+            return config.CHROMEDRIVER_PATH
+        
+        # Reuse the path resolved by a previous run while it is still fresh
+        cache_file = config.CHROMEDRIVER_PATH_CACHE
+        try:
+            if time.time() - os.path.getmtime(cache_file) < config.CHROMEDRIVER_CACHE_DAYS * 86400:
+                with open(cache_file, encoding='utf-8') as f:
+                    cached_path = f.read().strip()
+                if os.path.isfile(cached_path):
+                    return cached_path
+        except OSError:
+            pass
+        
+        # Use webdriver-manager to automatically download and manage ChromeDriver
+        cache_manager = DriverCacheManager(valid_range=config.CHROMEDRIVER_CACHE_DAYS)
+        driver_path = ChromeDriverManager(cache_manager=cache_manager).install()
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                f.write(driver_path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache ChromeDriver path: {e}")
+        
+        return driver_path
+    
+    def extract_property_data(self, property_element, timestamp: str) -> Optional[Dict]:
         """Extract property data from a single property element."""
         try:
             property_data = {
@@ -97,61 +139,34 @@ class PortalInmobiliarioScraper:
                 'bedrooms': None,
                 'bathrooms': None,
                 'square_meters': None,
-                'raw_text': '',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
             
-            # Get the raw text for debugging
+            # Get the raw text; it is only kept in the output when requested
             raw_text = property_element.text.strip()
-            property_data['raw_text'] = raw_text
-            
-            # Extract price
-            for pattern in config.PRICE_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    price_str = match.group(1).replace(',', '')
-                    try:
-                        property_data['price'] = int(price_str)
-                        break
-                    except ValueError:
-                        continue
-            
-            # Extract square meters
-            for pattern in config.SQUARE_METERS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    try:
-                        property_data['square_meters'] = int(match.group(1))
-                        break
-                    except ValueError:
-                        continue
+            if config.INCLUDE_RAW_TEXT:
+                property_data['raw_text'] = raw_text
+            else:
+                self.logger.debug(f"Raw text: {raw_text}")
             
-            # Extract bedrooms
-            for pattern in config.BEDROOMS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
+            # Extract price, square meters, bedrooms and bathrooms;
+            # per field the highest-priority pattern that parses wins
+            numeric_fields = config.find_numeric_fields(raw_text)
+            for field, candidates in numeric_fields.items():
+                for value in candidates:
                     try:
-                        property_data['bedrooms'] = int(match.group(1))
+                        property_data[field] = int(value.replace(',', ''))
                         break
                     except ValueError:
                         continue
             
-            # Extract bathrooms
-            for pattern in config.BATHROOMS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    try:
-                        property_data['bathrooms'] = int(match.group(1))
+            # Extract location/address (every address pattern starts with an uppercase letter)
+            if config.UPPERCASE_REGEX.search(raw_text):
+                for regex in config.ADDRESS_REGEXES:
+                    match = regex.search(raw_text)
+                    if match:
+                        property_data['location'] = match.group(0).strip()
                         break
-                    except ValueError:
-                        continue
-            
-            # Extract location/address
-            for pattern in config.ADDRESS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    property_data['location'] = match.group(0).strip()
-                    break
             
             # Validate data
             if self._validate_property_data(property_data):
@@ -166,24 +181,29 @@ class PortalInmobiliarioScraper:
     
     def _validate_property_data(self, data: Dict) -> bool:
         """Validate extracted property data."""
+        price = data.get('price')
+        square_meters = data.get('square_meters')
+        
         # Check if we have at least some basic data
-        if not data.get('price') and not data.get('location'):
+        if not price and not data.get('location'):
             return False
         
         # Validate price range
-        if data.get('price'):
-            if not (config.MIN_PRICE <= data['price'] <= config.MAX_PRICE):
-                return False
+        if price and not (config.MIN_PRICE <= price <= config.MAX_PRICE):
+            return False
         
         # Validate square meters
-        if data.get('square_meters'):
-            if not (config.MIN_SQUARE_METERS <= data['square_meters'] <= config.MAX_SQUARE_METERS):
-                return False
+        if square_meters and not (config.MIN_SQUARE_METERS <= square_meters <= config.MAX_SQUARE_METERS):
+            return False
         
         return True
     
     def scrape_page(self, url: str) -> List[Dict]:
         """Scrape a single page and extract property data."""
+        # Without JavaScript the page is static, so a plain HTTP fetch is enough
+        if self.http_scraper:
+            return self.http_scraper.scrape_page(url)
+        
         properties = []
         
         try:
@@ -195,25 +215,21 @@ class PortalInmobiliarioScraper:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # Find property containers
-            property_elements = []
-            for selector in config.PROPERTY_SELECTORS:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        property_elements = elements
-                        self.logger.info(f"Found {len(elements)} properties using selector: {selector}")
-                        break
-                except NoSuchElementException:
-                    continue
+            # Find property containers (one WebDriver round trip for all selectors)
+            selector, property_elements = self.driver.execute_script(
+                FIRST_MATCHING_SELECTOR_SCRIPT, config.PROPERTY_SELECTORS
+            )
+            if property_elements:
+                self.logger.info(f"Found {len(property_elements)} properties using selector: {selector}")
             
             if not property_elements:
                 self.logger.warning("No property elements found on page")
                 return properties
             
-            # Extract data from each property
+            # Extract data from each property; all share the page's fetch time
+            timestamp = datetime.now().isoformat()
             for element in property_elements:
-                property_data = self.extract_property_data(element)
+                property_data = self.extract_property_data(element, timestamp)
                 if property_data:
                     properties.append(property_data)
                     self.logger.debug(f"Extracted property: {property_data.get('price')} CLP")
@@ -241,7 +257,7 @@ class PortalInmobiliarioScraper:
                 
                 # Scrape the page
                 page_properties = self.scrape_page(url)
-                self.properties.extend(page_properties)
+                self.writer.write(page_properties)
                 
                 self.logger.info(f"Page {page}: Found {len(page_properties)} properties")
                 
@@ -254,63 +270,37 @@ class PortalInmobiliarioScraper:
                 self.logger.error(f"Error scraping page {page}: {e}")
                 break
         
-        self.logger.info(f"Scraping completed. Total properties found: {len(self.properties)}")
-    
-    def export_data(self):
-        """Export scraped data to CSV and JSON files."""
-        if not self.properties:
-            self.logger.warning("No properties to export")
-            return
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Export to JSON
-        if "json" in config.OUTPUT_FORMATS:
-            json_filename = f"{config.OUTPUT_PREFIX}_{timestamp}.json"
-            try:
-                with open(json_filename, 'w', encoding=config.ENCODING) as f:
-                    json.dump(self.properties, f, indent=2, ensure_ascii=False)
-                self.logger.info(f"Data exported to JSON: {json_filename}")
-            except Exception as e:
-                self.logger.error(f"Error exporting to JSON: {e}")
-        
-        # Export to CSV
-        if "csv" in config.OUTPUT_FORMATS:
-            csv_filename = f"{config.OUTPUT_PREFIX}_{timestamp}.csv"
-            try:
-                with open(csv_filename, 'w', newline='', encoding=config.ENCODING) as f:
-                    if self.properties:
-                        fieldnames = self.properties[0].keys()
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(self.properties)
-                self.logger.info(f"Data exported to CSV: {csv_filename}")
-            except Exception as e:
-                self.logger.error(f"Error exporting to CSV: {e}")
+        self.logger.info(f"Scraping completed. Total properties found: {self.writer.count}")
     
     def run(self):
         """Main method to run the scraper."""
         try:
             self.logger.info("Starting Portal Inmobiliario scraper (Selenium version)")
             
-            # Setup WebDriver
-            self.setup_driver()
+            # Setup WebDriver only when the pages need JavaScript to render
+            if self.require_js:
+                self.setup_driver()
+            else:
+                self.logger.info("JavaScript not required, fetching pages over HTTP")
+                self.http_scraper = MinimalPortalInmobiliarioScraper()
             
-            # Scrape all pages
+            # Scrape all pages, streaming each page's properties to disk
+            self.writer = PropertyWriter()
             self.scrape_all_pages()
             
-            # Export data
-            self.export_data()
-            
             self.logger.info("Scraping completed successfully!")
             
         except Exception as e:
             self.logger.error(f"Scraping failed: {e}")
             raise
         finally:
+            if self.writer:
+                self.writer.close()
             if self.driver:
                 self.driver.quit()
                 self.logger.info("WebDriver closed")
+            if self.http_scraper:
+                self.http_scraper.session.close()
 
 
 def main():
@@ -7,10 +7,7 @@ and lower resource usage. Good for static content.
 """
 
 import time
-import json
-import csv
 import logging
-import re
 from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin, urlparse
@@ -20,6 +17,7 @@ from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 
 import config
+from property_writer import PropertyWriter
 
 
 class SimplePortalInmobiliarioScraper:
@@ -33,7 +31,6 @@ class SimplePortalInmobiliarioScraper:
         self.delay_between_requests = config.DELAY_BETWEEN_REQUESTS
         self.timeout = config.REQUEST_TIMEOUT
         self.max_retries = config.MAX_RETRIES
-        self.retry_delay = config.RETRY_DELAY
         self.headers = config.REQUEST_HEADERS.copy()
         
         # Setup User-Agent
@@ -54,33 +51,26 @@ class SimplePortalInmobiliarioScraper:
         )
         self.logger = logging.getLogger(__name__)
         
-        # Initialize data storage
-        self.properties = []
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # Output writer, created when the run starts
+        self.writer = None
+        self.session = config.make_session(self.headers)
     
     def make_request(self, url: str) -> Optional[BeautifulSoup]:
         """Make HTTP request and return BeautifulSoup object."""
-        for attempt in range(self.max_retries):
-            try:
-                self.logger.debug(f"Making request to: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return soup
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    self.logger.error(f"All retry attempts failed for: {url}")
-                    return None
-        
-        return None
+        # Retries and back-off happen inside the session's connection adapter
+        try:
+            self.logger.debug(f"Making request to: {url}")
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            
+            soup = BeautifulSoup(response.content, config.HTML_PARSER)
+            return soup
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Request failed for {url}: {e}")
+            return None
     
-    def extract_property_data(self, property_element) -> Optional[Dict]:
+    def extract_property_data(self, property_element, timestamp: str) -> Optional[Dict]:
         """Extract property data from a single property element."""
         try:
             property_data = {
@@ -89,61 +79,34 @@ class SimplePortalInmobiliarioScraper:
                 'bedrooms': None,
                 'bathrooms': None,
                 'square_meters': None,
-                'raw_text': '',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
             
-            # Get the raw text for debugging
-            raw_text = property_element.get_text(strip=True)
-            property_data['raw_text'] = raw_text
-            
-            # Extract price
-            for pattern in config.PRICE_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    price_str = match.group(1).replace(',', '')
-                    try:
-                        property_data['price'] = int(price_str)
-                        break
-                    except ValueError:
-                        continue
+            # Get the raw text; it is only kept in the output when requested
+            raw_text = property_element.get_text(' ', strip=True)
+            if config.INCLUDE_RAW_TEXT:
+                property_data['raw_text'] = raw_text
+            else:
+                self.logger.debug(f"Raw text: {raw_text}")
             
-            # Extract square meters
-            for pattern in config.SQUARE_METERS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
+            # Extract price, square meters, bedrooms and bathrooms;
+            # per field the highest-priority pattern that parses wins
+            numeric_fields = config.find_numeric_fields(raw_text)
+            for field, candidates in numeric_fields.items():
+                for value in candidates:
                     try:
-                        property_data['square_meters'] = int(match.group(1))
+                        property_data[field] = int(value.replace(',', ''))
                         break
                     except ValueError:
                         continue
             
-            # Extract bedrooms
-            for pattern in config.BEDROOMS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    try:
-                        property_data['bedrooms'] = int(match.group(1))
+            # Extract location/address (every address pattern starts with an uppercase letter)
+            if config.UPPERCASE_REGEX.search(raw_text):
+                for regex in config.ADDRESS_REGEXES:
+                    match = regex.search(raw_text)
+                    if match:
+                        property_data['location'] = match.group(0).strip()
                         break
-                    except ValueError:
-                        continue
-            
-            # Extract bathrooms
-            for pattern in config.BATHROOMS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    try:
-                        property_data['bathrooms'] = int(match.group(1))
-                        break
-                    except ValueError:
-                        continue
-            
-            # Extract location/address
-            for pattern in config.ADDRESS_PATTERNS:
-                match = re.search(pattern, raw_text)
-                if match:
-                    property_data['location'] = match.group(0).strip()
-                    break
             
             # Validate data
             if self._validate_property_data(property_data):
@@ -158,19 +121,20 @@ class SimplePortalInmobiliarioScraper:
     
     def _validate_property_data(self, data: Dict) -> bool:
         """Validate extracted property data."""
+        price = data.get('price')
+        square_meters = data.get('square_meters')
+        
         # Check if we have at least some basic data
-        if not data.get('price') and not data.get('location'):
+        if not price and not data.get('location'):
             return False
         
         # Validate price range
-        if data.get('price'):
-            if not (config.MIN_PRICE <= data['price'] <= config.MAX_PRICE):
-                return False
+        if price and not (config.MIN_PRICE <= price <= config.MAX_PRICE):
+            return False
         
         # Validate square meters
-        if data.get('square_meters'):
-            if not (config.MIN_SQUARE_METERS <= data['square_meters'] <= config.MAX_SQUARE_METERS):
-                return False
+        if square_meters and not (config.MIN_SQUARE_METERS <= square_meters <= config.MAX_SQUARE_METERS):
+            return False
         
         return True
     
@@ -188,23 +152,21 @@ class SimplePortalInmobiliarioScraper:
             
             # Find property containers
             property_elements = []
-            for selector in config.PROPERTY_SELECTORS:
-                try:
-                    elements = soup.select(selector)
-                    if elements:
-                        property_elements = elements
-                        self.logger.info(f"Found {len(elements)} properties using selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            for selector, compiled in config.COMPILED_PROPERTY_SELECTORS:
+                elements = compiled.select(soup)
+                if elements:
+                    property_elements = elements
+                    self.logger.info(f"Found {len(elements)} properties using selector: {selector}")
+                    break
             
             if not property_elements:
                 self.logger.warning("No property elements found on page")
                 return properties
             
-            # Extract data from each property
+            # Extract data from each property; all share the page's fetch time
+            timestamp = datetime.now().isoformat()
             for element in property_elements:
-                property_data = self.extract_property_data(element)
+                property_data = self.extract_property_data(element, timestamp)
                 if property_data:
                     properties.append(property_data)
                     self.logger.debug(f"Extracted property: {property_data.get('price')} CLP")
@@ -230,7 +192,7 @@ class SimplePortalInmobiliarioScraper:
                 
                 # Scrape the page
                 page_properties = self.scrape_page(url)
-                self.properties.extend(page_properties)
+                self.writer.write(page_properties)
                 
                 self.logger.info(f"Page {page}: Found {len(page_properties)} properties")
                 
@@ -243,57 +205,25 @@ class SimplePortalInmobiliarioScraper:
                 self.logger.error(f"Error scraping page {page}: {e}")
                 break
         
-        self.logger.info(f"Scraping completed. Total properties found: {len(self.properties)}")
-    
-    def export_data(self):
-        """Export scraped data to CSV and JSON files."""
-        if not self.properties:
-            self.logger.warning("No properties to export")
-            return
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Export to JSON
-        if "json" in config.OUTPUT_FORMATS:
-            json_filename = f"{config.OUTPUT_PREFIX}_{timestamp}.json"
-            try:
-                with open(json_filename, 'w', encoding=config.ENCODING) as f:
-                    json.dump(self.properties, f, indent=2, ensure_ascii=False)
-                self.logger.info(f"Data exported to JSON: {json_filename}")
-            except Exception as e:
-                self.logger.error(f"Error exporting to JSON: {e}")
-        
-        # Export to CSV
-        if "csv" in config.OUTPUT_FORMATS:
-            csv_filename = f"{config.OUTPUT_PREFIX}_{timestamp}.csv"
-            try:
-                with open(csv_filename, 'w', newline='', encoding=config.ENCODING) as f:
-                    if self.properties:
-                        fieldnames = self.properties[0].keys()
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(self.properties)
-                self.logger.info(f"Data exported to CSV: {csv_filename}")
-            except Exception as e:
-                self.logger.error(f"Error exporting to CSV: {e}")
+        self.logger.info(f"Scraping completed. Total properties found: {self.writer.count}")
     
     def run(self):
         """Main method to run the scraper."""
         try:
             self.logger.info("Starting Portal Inmobiliario scraper (Simple requests version)")
             
-            # Scrape all pages
+            # Scrape all pages, streaming each page's properties to disk
+            self.writer = PropertyWriter()
             self.scrape_all_pages()
             
-            # Export data
-            self.export_data()
-            
             self.logger.info("Scraping completed successfully!")
             
         except Exception as e:
             self.logger.error(f"Scraping failed: {e}")
             raise
         finally:
+            if self.writer:
+                self.writer.close()
             self.session.close()
 
 
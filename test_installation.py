@@ -5,11 +5,12 @@ Test script for Portal Inmobiliario scraper installation and basic functionality
 
 import sys
 import importlib
+import importlib.util
 import logging
 from datetime import datetime
 
-def test_imports():
-    """Test if all required modules can be imported."""
+def test_imports(verbose=False):
+    """Test if all required modules are installed (imported only in verbose mode)."""
     print("🔍 Testing module imports...")
     
     required_modules = [
@@ -26,9 +27,20 @@ def test_imports():
     failed_imports = []
     
     for module in required_modules:
-        try:
-            importlib.import_module(module)
+        # find_spec only locates the module, so heavy packages are not loaded
+        if importlib.util.find_spec(module) is None:
+            print(f"❌ {module}: not installed")
+            failed_imports.append(module)
+            continue
+        
+        if not verbose:
             print(f"✅ {module}")
+            continue
+        
+        # Verbose mode imports the module to catch broken installs and report its version
+        try:
+            imported = importlib.import_module(module)
+            print(f"✅ {module} {getattr(imported, '__version__', '')}".rstrip())
         except ImportError as e:
             print(f"❌ {module}: {e}")
             failed_imports.append(module)
@@ -105,13 +117,13 @@ def test_environment_variables():
         print(f"❌ Environment variable test failed: {e}")
         return False
 
-def main():
+def main(verbose=False):
     """Run all tests."""
     print("🚀 Portal Inmobiliario Scraper - Installation Test")
     print("=" * 50)
     
     tests = [
-        ("Module Imports", test_imports),
+        ("Module Imports", lambda: test_imports(verbose)),
         ("Configuration", test_config),
         ("Basic Functionality", test_basic_functionality),
         ("Environment Variables", test_environment_variables)
@@ -147,5 +159,5 @@ def main():
     return passed == total
 
 if __name__ == "__main__":
-    success = main()
+    success = main(verbose='--verbose' in sys.argv[1:])
     sys.exit(0 if success else 1) 
\ No newline at end of file
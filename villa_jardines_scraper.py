@@ -8,36 +8,69 @@ URL: https://www.portalinmobiliario.com/venta/casa/rm-metropolitana/nunoa/villa-
 
 import time
 import json
+import math
 import csv
 import logging
+import random
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson  # Optional: several times faster than the json module
+except ImportError:
+    orjson = None
 
 
 class VillaJardinesScraper:
     """Specialized scraper for Villa Los Jardines - Villa Los Presidentes properties."""
     
+    # Output columns, in the order extract_property_data builds each property
+    FIELDNAMES = (
+        'title', 'price', 'price_currency', 'location', 'bedrooms', 'bathrooms',
+        'square_meters', 'address', 'features', 'raw_text', 'timestamp'
+    )
+    
+    # Amenities reported in the 'features' column, in output order
+    FEATURE_KEYWORDS = (
+        'jardín', 'estacionamiento', 'piscina', 'parrilla', 'alarma',
+        'aire acondicionado', 'gimnasio', 'quincho'
+    )
+    
+    # Paging metadata in the page's __PRELOADED_STATE__, e.g. "paging":{"total":96,"offset":0,"limit":48}
+    PAGING_REGEX = re.compile(rb'"paging"\s*:\s*(\{[^{}]*\})')
+    
+    # Markup for the container selectors a class-based strainer cannot see:
+    # 'article' and '[data-testid*="result"]'
+    UNSTRAINABLE_CONTAINER_REGEX = re.compile(rb'<article\b|data-testid\s*=\s*["\']?[^"\'>]*result', re.IGNORECASE)
+    
     def __init__(self):
         """Initialize the scraper with Villa Los Jardines specific configuration."""
         self.base_url = "https://www.portalinmobiliario.com/venta/casa/rm-metropolitana/nunoa/villa-los-jardines---villa-los-presidentes"
         self.max_pages = 10  # Adjust based on actual page count
         self.delay_between_pages = 3
+        self.max_workers = 4  # Pages fetched in parallel (1 = sequential with delays)
         self.delay_between_requests = 2
         self.timeout = 30
         self.max_retries = 3
-        self.retry_delay = 5
+        self.retry_delay = 5  # Base for the exponential back-off between retries
+        self.keep_raw_text = False  # Keep each listing's full text in the output for debugging
         
         # Headers optimized for Portal Inmobiliario
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'es-ES,es;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING,  # includes br when brotli is installed
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0',
@@ -56,64 +89,193 @@ class VillaJardinesScraper:
         
         # Initialize data storage
         self.properties = []
+        self._seen = set()  # (title, price, address) of every property kept so far
+        self.page_count = None  # Number of results pages, read from the first page that reports it
+        
+        # Shared pacing for concurrent page fetches: the next time a request may start
+        self._request_lock = threading.Lock()
+        self._next_request_time = 0.0
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # Retry failed connections and throttling/server errors with exponential back-off,
+        # waiting as long as a Retry-After header asks
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.retry_delay,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # One pooled keep-alive connection per concurrent page fetch
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-        # Villa Los Jardines specific patterns
-        self.price_patterns = [
+        # Villa Los Jardines specific patterns, compiled once
+        self.price_patterns = self._compile_patterns([
             r'\$([\d,]+)',
             r'UF([\d,]+)',
             r'(\d+)\s*pesos',
             r'(\d+)\s*CLP'
-        ]
+        ])
         
-        self.square_meters_patterns = [
+        self.square_meters_patterns = self._compile_patterns([
             r'(\d+)\s*m²\s*útiles',
             r'(\d+)\s*m²',
             r'(\d+)\s*metros',
             r'(\d+)\s*m2'
-        ]
+        ])
         
-        self.bedrooms_patterns = [
+        self.bedrooms_patterns = self._compile_patterns([
             r'(\d+)\s*dormitorio',
             r'(\d+)\s*habitación',
             r'(\d+)\s*pieza'
-        ]
+        ])
         
-        self.bathrooms_patterns = [
+        self.bathrooms_patterns = self._compile_patterns([
             r'(\d+)\s*baño',
             r'(\d+)\s*baños'
-        ]
+        ])
         
-        self.address_patterns = [
+        self.address_patterns = self._compile_patterns([
             r'[A-Z][a-z]+.*?Ñuñoa',
             r'[A-Z][a-z]+.*?Villa Los Jardínes',
             r'[A-Z][a-z]+.*?Villa Los Presidentes',
             r'[A-Z][a-z]+.*?Región Metropolitana'
-        ]
+        ])
+        
+        # CSS selectors, compiled once and tried in priority order
+        self.container_selectors = self._compile_selectors([
+            'article',
+            '.ui-search-result',
+            '.ui-search-result__wrapper',
+            '[data-testid*="result"]',
+            '.ui-search-result__content',
+            'div[class*="result"]',
+            'div[class*="item"]',
+            'div[class*="property"]',
+            'div[class*="listing"]',
+            'li[class*="result"]',
+            'div[class*="card"]'
+        ])
+        
+        # Only build the tree for elements whose class a container selector looks for,
+        # skipping the head, scripts, navigation and footer (see _parse_page)
+        self.listing_strainer = SoupStrainer(class_=re.compile(r'result|item|property|listing|card'))
+        
+        self.title_selectors = self._compile_selectors([
+            '.poly-component__title',
+            'h3',
+            'h2',
+            'h1',
+            '.ui-search-item__title',
+            '[class*="title"]',
+            '[class*="name"]'
+        ])
+        
+        self.price_selectors = self._compile_selectors([
+            '.poly-component__price .andes-money-amount__fraction',
+            '.andes-money-amount__fraction',
+            '.ui-search-price__part',
+            '.ui-search-price',
+            '[class*="price"]',
+            '.andes-money-amount'
+        ])
+        
+        self.square_meters_selectors = self._compile_selectors([
+            '.poly-attributes_list__item',
+            '[class*="size"]',
+            '[class*="area"]',
+            '[class*="meters"]'
+        ])
+        
+        self.details_selectors = self._compile_selectors([
+            '.poly-attributes_list__item',
+            '[class*="bedroom"]',
+            '[class*="bathroom"]',
+            '[class*="room"]',
+            '.ui-search-item__group__element'
+        ])
+        
+        self.address_selectors = self._compile_selectors([
+            '.poly-component__location',
+            '[class*="location"]',
+            '[class*="address"]',
+            '[class*="neighborhood"]'
+        ])
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> List[re.Pattern]:
+        """Compile regex patterns so each search skips the re module's cache lookup."""
+        return [re.compile(pattern) for pattern in patterns]
+    
+    @staticmethod
+    def _compile_selectors(selectors: List[str]) -> List[soupsieve.SoupSieve]:
+        """Compile CSS selectors so they are not re-parsed for every property."""
+        return [soupsieve.compile(selector) for selector in selectors]
+    
+    @staticmethod
+    def _cached_text(element, cache: Dict[int, str]) -> str:
+        """Return element.get_text(strip=True), computing it once per element."""
+        text = cache.get(id(element))
+        if text is None:
+            text = cache[id(element)] = element.get_text(strip=True)
+        return text
+    
+    @staticmethod
+    def _search_int(patterns: List[re.Pattern], text: str, default: Optional[int] = None) -> Optional[int]:
+        """Return the first group of the highest-priority pattern that parses as an int, else default."""
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                try:
+                    return int(match.group(1))
+                except ValueError:
+                    continue
+        return default
+    
+    def _read_page_count(self, content: bytes) -> Optional[int]:
+        """Return the number of results pages from the embedded paging metadata, if present."""
+        match = self.PAGING_REGEX.search(content)
+        if not match:
+            return None
+        try:
+            paging = json.loads(match.group(1))
+            total, limit = int(paging['total']), int(paging['limit'])
+        except (ValueError, KeyError, TypeError):
+            return None
+        if limit <= 0:
+            return None
+        self.logger.info(f"Listing reports {total} properties, {limit} per page")
+        return max(1, math.ceil(total / limit))
+    
+    def _parse_page(self, content: bytes) -> BeautifulSoup:
+        """Parse a results page, building only the listing elements when no container needs the full tree."""
+        # The strainer keeps elements by class, so it would drop containers matched
+        # by tag or data-testid alone; pages that have any are parsed in full
+        if self.UNSTRAINABLE_CONTAINER_REGEX.search(content):
+            return BeautifulSoup(content, 'lxml')
+        return BeautifulSoup(content, 'lxml', parse_only=self.listing_strainer)
     
     def make_request(self, url: str) -> Optional[BeautifulSoup]:
         """Make HTTP request and return BeautifulSoup object."""
-        for attempt in range(self.max_retries):
-            try:
-                self.logger.debug(f"Making request to: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                return soup
-                
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    self.logger.error(f"All retry attempts failed for: {url}")
-                    return None
-        
-        return None
+        # Retries and back-off happen inside the session's connection adapter
+        try:
+            self.logger.debug(f"Making request to: {url}")
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            
+            if self.page_count is None:
+                self.page_count = self._read_page_count(response.content)
+            
+            soup = self._parse_page(response.content)
+            return soup
+            
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Request failed for {url}: {e}")
+            return None
     
-    def extract_property_data(self, property_element) -> Optional[Dict]:
+    def extract_property_data(self, property_element, timestamp: str) -> Optional[Dict]:
         """Extract property data from a single property element."""
         try:
             property_data = {
@@ -127,7 +289,7 @@ class VillaJardinesScraper:
                 'address': None,
                 'features': [],
                 'raw_text': '',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp
             }
             
             # Get the raw text for debugging
@@ -135,18 +297,8 @@ class VillaJardinesScraper:
             property_data['raw_text'] = raw_text
             
             # Extract title - look for specific title classes
-            title_selectors = [
-                '.poly-component__title',
-                'h3',
-                'h2', 
-                'h1',
-                '.ui-search-item__title',
-                '[class*="title"]',
-                '[class*="name"]'
-            ]
-            
-            for selector in title_selectors:
-                title_element = property_element.select_one(selector)
+            for selector in self.title_selectors:
+                title_element = selector.select_one(property_element)
                 if title_element:
                     title_text = title_element.get_text(strip=True)
                     if title_text and len(title_text) > 5:  # Basic validation
@@ -154,23 +306,15 @@ class VillaJardinesScraper:
                         break
             
             # Extract price - look for price elements first, then use regex
-            price_selectors = [
-                '.poly-component__price .andes-money-amount__fraction',
-                '.andes-money-amount__fraction',
-                '.ui-search-price__part',
-                '.ui-search-price',
-                '[class*="price"]',
-                '.andes-money-amount'
-            ]
-            
-            for selector in price_selectors:
-                price_element = property_element.select_one(selector)
+            for selector in self.price_selectors:
+                price_element = selector.select_one(property_element)
                 if price_element:
                     price_text = price_element.get_text(strip=True)
                     # For the specific Portal Inmobiliario format, try direct extraction first
-                    if price_text and price_text.replace('.', '').replace(',', '').isdigit():
+                    price_digits = price_text.replace('.', '').replace(',', '')
+                    if price_digits.isdigit():
                         try:
-                            property_data['price'] = int(price_text.replace('.', '').replace(',', ''))
+                            property_data['price'] = int(price_digits)
                             property_data['price_currency'] = 'CLP'
                             break
                         except ValueError:
@@ -178,7 +322,7 @@ class VillaJardinesScraper:
                     
                     # Try to extract price from the element text using patterns
                     for pattern in self.price_patterns:
-                        match = re.search(pattern, price_text)
+                        match = pattern.search(price_text)
                         if match:
                             price_str = match.group(1).replace(',', '').replace('.', '')
                             try:
@@ -194,12 +338,12 @@ class VillaJardinesScraper:
             # If no price found in elements, try regex on raw text
             if not property_data.get('price'):
                 for pattern in self.price_patterns:
-                    match = re.search(pattern, raw_text)
+                    match = pattern.search(raw_text)
                     if match:
                         price_str = match.group(1).replace(',', '').replace('.', '')
                         try:
                             property_data['price'] = int(price_str)
-                            if 'UF' in pattern:
+                            if 'UF' in pattern.pattern:
                                 property_data['price_currency'] = 'UF'
                             else:
                                 property_data['price_currency'] = 'CLP'
@@ -207,105 +351,55 @@ class VillaJardinesScraper:
                         except ValueError:
                             continue
             
-            # Extract square meters - look for specific elements first
-            square_meters_selectors = [
-                '.poly-attributes_list__item',
-                '[class*="size"]',
-                '[class*="area"]',
-                '[class*="meters"]'
-            ]
+            # Text of matched sub-elements, cached because the size and room lookups
+            # both read the attribute list items
+            element_texts = {}
             
-            for selector in square_meters_selectors:
-                element = property_element.select_one(selector)
+            # Extract square meters - look for specific elements first
+            for selector in self.square_meters_selectors:
+                element = selector.select_one(property_element)
                 if element:
-                    element_text = element.get_text(strip=True)
-                    for pattern in self.square_meters_patterns:
-                        match = re.search(pattern, element_text)
-                        if match:
-                            try:
-                                property_data['square_meters'] = int(match.group(1))
-                                break
-                            except ValueError:
-                                continue
+                    element_text = self._cached_text(element, element_texts)
+                    property_data['square_meters'] = self._search_int(
+                        self.square_meters_patterns, element_text, property_data['square_meters'])
             
             # If no square meters found in elements, try regex on raw text
             if not property_data.get('square_meters'):
-                for pattern in self.square_meters_patterns:
-                    match = re.search(pattern, raw_text)
-                    if match:
-                        try:
-                            property_data['square_meters'] = int(match.group(1))
-                            break
-                        except ValueError:
-                            continue
+                property_data['square_meters'] = self._search_int(
+                    self.square_meters_patterns, raw_text, property_data['square_meters'])
             
             # Extract bedrooms and bathrooms - look for specific elements first
-            details_selectors = [
-                '.poly-attributes_list__item',
-                '[class*="bedroom"]',
-                '[class*="bathroom"]',
-                '[class*="room"]',
-                '.ui-search-item__group__element'
-            ]
-            
-            for selector in details_selectors:
-                elements = property_element.select(selector)
+            for selector in self.details_selectors:
+                if property_data.get('bedrooms') and property_data.get('bathrooms'):
+                    break
+                elements = selector.select(property_element)
                 for element in elements:
-                    element_text = element.get_text(strip=True)
+                    if property_data.get('bedrooms') and property_data.get('bathrooms'):
+                        break
+                    element_text = self._cached_text(element, element_texts)
                     
                     # Check for bedrooms
                     if not property_data.get('bedrooms'):
-                        for pattern in self.bedrooms_patterns:
-                            match = re.search(pattern, element_text)
-                            if match:
-                                try:
-                                    property_data['bedrooms'] = int(match.group(1))
-                                    break
-                                except ValueError:
-                                    continue
+                        property_data['bedrooms'] = self._search_int(
+                            self.bedrooms_patterns, element_text, property_data['bedrooms'])
                     
                     # Check for bathrooms
                     if not property_data.get('bathrooms'):
-                        for pattern in self.bathrooms_patterns:
-                            match = re.search(pattern, element_text)
-                            if match:
-                                try:
-                                    property_data['bathrooms'] = int(match.group(1))
-                                    break
-                                except ValueError:
-                                    continue
+                        property_data['bathrooms'] = self._search_int(
+                            self.bathrooms_patterns, element_text, property_data['bathrooms'])
             
             # If not found in elements, try regex on raw text
             if not property_data.get('bedrooms'):
-                for pattern in self.bedrooms_patterns:
-                    match = re.search(pattern, raw_text)
-                    if match:
-                        try:
-                            property_data['bedrooms'] = int(match.group(1))
-                            break
-                        except ValueError:
-                            continue
+                property_data['bedrooms'] = self._search_int(
+                    self.bedrooms_patterns, raw_text, property_data['bedrooms'])
             
             if not property_data.get('bathrooms'):
-                for pattern in self.bathrooms_patterns:
-                    match = re.search(pattern, raw_text)
-                    if match:
-                        try:
-                            property_data['bathrooms'] = int(match.group(1))
-                            break
-                        except ValueError:
-                            continue
+                property_data['bathrooms'] = self._search_int(
+                    self.bathrooms_patterns, raw_text, property_data['bathrooms'])
             
             # Extract address/location
-            address_selectors = [
-                '.poly-component__location',
-                '[class*="location"]',
-                '[class*="address"]',
-                '[class*="neighborhood"]'
-            ]
-            
-            for selector in address_selectors:
-                element = property_element.select_one(selector)
+            for selector in self.address_selectors:
+                element = selector.select_one(property_element)
                 if element:
                     address_text = element.get_text(strip=True)
                     if address_text and len(address_text) > 5:
@@ -315,21 +409,19 @@ class VillaJardinesScraper:
             # If no address found in elements, try regex on raw text
             if not property_data.get('address'):
                 for pattern in self.address_patterns:
-                    match = re.search(pattern, raw_text)
+                    match = pattern.search(raw_text)
                     if match:
                         property_data['address'] = match.group(0).strip()
                         break
             
             # Extract features (garden, parking, etc.)
-            features = []
-            feature_keywords = ['jardín', 'estacionamiento', 'piscina', 'parrilla', 'alarma', 'aire acondicionado', 'gimnasio', 'quincho']
-            for keyword in feature_keywords:
-                if keyword in raw_text.lower():
-                    features.append(keyword)
-            property_data['features'] = features
+            lower_text = raw_text.lower()
+            property_data['features'] = [keyword for keyword in self.FEATURE_KEYWORDS if keyword in lower_text]
             
             # More lenient validation for this specific area
             if self._validate_property_data(property_data):
+                if not self.keep_raw_text:
+                    del property_data['raw_text']
                 return property_data
             else:
                 self.logger.debug(f"Property data validation failed: {property_data}")
@@ -376,37 +468,21 @@ class VillaJardinesScraper:
             
             # Find property containers - multiple selectors for Portal Inmobiliario
             property_elements = []
-            selectors = [
-                'article',
-                '.ui-search-result',
-                '.ui-search-result__wrapper',
-                '[data-testid*="result"]',
-                '.ui-search-result__content',
-                'div[class*="result"]',
-                'div[class*="item"]',
-                'div[class*="property"]',
-                'div[class*="listing"]',
-                'li[class*="result"]',
-                'div[class*="card"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    elements = soup.select(selector)
-                    if elements:
-                        property_elements = elements
-                        self.logger.info(f"Found {len(elements)} properties using selector: {selector}")
-                        break
-                except Exception:
-                    continue
+            for selector in self.container_selectors:
+                elements = selector.select(soup)
+                if elements:
+                    property_elements = elements
+                    self.logger.info(f"Found {len(elements)} properties using selector: {selector.pattern}")
+                    break
             
             if not property_elements:
                 self.logger.warning("No property elements found on page")
                 return properties
             
-            # Extract data from each property
+            # Extract data from each property; all share the page's fetch time
+            timestamp = datetime.now().isoformat()
             for element in property_elements:
-                property_data = self.extract_property_data(element)
+                property_data = self.extract_property_data(element, timestamp)
                 if property_data:
                     properties.append(property_data)
                     self.logger.debug(f"Extracted property: {property_data.get('title', 'No title')} - {property_data.get('price')} {property_data.get('price_currency', 'CLP')}")
@@ -418,39 +494,109 @@ class VillaJardinesScraper:
         
         return properties
     
+    def _page_url(self, page: int) -> str:
+        """Build the URL for a results page (page 1 has no query string)."""
+        if page == 1:
+            return self.base_url
+        return f"{self.base_url}?page={page}"
+    
+    def _add_properties(self, page_properties: List[Dict]):
+        """Keep the properties not already seen, e.g. listings repeated on a later page."""
+        for property_data in page_properties:
+            key = (property_data['title'], property_data['price'], property_data['address'])
+            if key in self._seen:
+                self.logger.debug(f"Skipping duplicate property: {property_data['title']}")
+                continue
+            self._seen.add(key)
+            self.properties.append(property_data)
+    
     def scrape_all_pages(self):
         """Scrape all pages within the configured limit."""
         self.logger.info(f"Starting to scrape up to {self.max_pages} pages")
         
-        for page in range(1, self.max_pages + 1):
-            try:
-                # Construct page URL
-                if page == 1:
-                    url = self.base_url
+        # Page 1 is fetched on its own: its paging metadata tells how many pages exist
+        page_properties = self.scrape_page(self._page_url(1))
+        if not page_properties:
+            self.logger.info("No properties found on page 1, stopping pagination")
+        else:
+            self._add_properties(page_properties)
+            self.logger.info(f"Page 1: Found {len(page_properties)} properties")
+            
+            last_page = self.max_pages
+            if self.page_count is not None and self.page_count < last_page:
+                last_page = self.page_count
+                self.logger.info(f"Only {last_page} pages of results, not requesting more")
+            
+            if last_page > 1:
+                if self.max_workers > 1:
+                    self._scrape_pages_concurrently(last_page)
                 else:
-                    url = f"{self.base_url}?page={page}"
+                    self._scrape_pages_sequentially(last_page)
+        
+        self.logger.info(f"Scraping completed. Total properties found: {len(self.properties)}")
+    
+    def _wait_for_request_slot(self):
+        """Block until the next request may start, spacing starts across all worker threads."""
+        # Concurrent workers share the page delay, so the overall request rate stays polite
+        interval = self.delay_between_pages / self.max_workers
+        with self._request_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + interval + random.uniform(0, interval / 4)
+        if start > now:
+            time.sleep(start - now)
+    
+    def _scrape_page_paced(self, url: str) -> List[Dict]:
+        """Scrape a page once the shared rate limiter allows another request."""
+        self._wait_for_request_slot()
+        return self.scrape_page(url)
+    
+    def _scrape_pages_concurrently(self, last_page: int):
+        """Fetch pages 2 to last_page in parallel threads, stopping at the first page without properties."""
+        workers = min(self.max_workers, last_page - 1)
+        self.logger.info(f"Fetching pages with {workers} concurrent workers")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._scrape_page_paced, self._page_url(page))
+                       for page in range(2, last_page + 1)]
+            
+            # Results are consumed in page order so pagination stops where it did sequentially
+            for page, future in enumerate(futures, start=2):
+                page_properties = future.result()
+                
+                if not page_properties:
+                    self.logger.info(f"No properties found on page {page}, stopping pagination")
+                    break
+                
+                self._add_properties(page_properties)
+                self.logger.info(f"Page {page}: Found {len(page_properties)} properties")
+            
+            # Drop requests for pages past the end that have not started yet
+            for future in futures:
+                future.cancel()
+    
+    def _scrape_pages_sequentially(self, last_page: int):
+        """Fetch pages 2 to last_page one at a time with a delay between them."""
+        for page in range(2, last_page + 1):
+            try:
+                # Delay between pages
+                self.logger.info(f"Waiting {self.delay_between_pages} seconds before next page...")
+                time.sleep(self.delay_between_pages)
                 
                 # Scrape the page
-                page_properties = self.scrape_page(url)
+                page_properties = self.scrape_page(self._page_url(page))
                 
                 if not page_properties:
                     self.logger.info(f"No properties found on page {page}, stopping pagination")
                     break
                 
-                self.properties.extend(page_properties)
+                self._add_properties(page_properties)
                 
                 self.logger.info(f"Page {page}: Found {len(page_properties)} properties")
                 
-                # Delay between pages
-                if page < self.max_pages:
-                    self.logger.info(f"Waiting {self.delay_between_pages} seconds before next page...")
-                    time.sleep(self.delay_between_pages)
-                
             except Exception as e:
                 self.logger.error(f"Error scraping page {page}: {e}")
                 break
-        
-        self.logger.info(f"Scraping completed. Total properties found: {len(self.properties)}")
     
     def export_data(self):
         """Export scraped data to CSV and JSON files."""
@@ -463,8 +609,12 @@ class VillaJardinesScraper:
         # Export to JSON
         json_filename = f"villa_jardines_properties_{timestamp}.json"
         try:
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(self.properties, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(json_filename, 'wb') as f:
+                    f.write(orjson.dumps(self.properties, option=orjson.OPT_INDENT_2))
+            else:
+                with open(json_filename, 'w', encoding='utf-8') as f:
+                    json.dump(self.properties, f, indent=2, ensure_ascii=False)
             self.logger.info(f"Data exported to JSON: {json_filename}")
         except Exception as e:
             self.logger.error(f"Error exporting to JSON: {e}")
@@ -473,11 +623,10 @@ class VillaJardinesScraper:
         csv_filename = f"villa_jardines_properties_{timestamp}.csv"
         try:
             with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                if self.properties:
-                    fieldnames = self.properties[0].keys()
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.properties)
+                fieldnames = [field for field in self.FIELDNAMES if self.keep_raw_text or field != 'raw_text']
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(self.properties)
             self.logger.info(f"Data exported to CSV: {csv_filename}")
         except Exception as e:
             self.logger.error(f"Error exporting to CSV: {e}")